@@ -1,12 +1,21 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import gc
 import glob
 import os
 import json
 import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import altair as alt
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 st.markdown(
     """
     <style>
@@ -17,57 +26,267 @@ st.markdown(
     """,
     unsafe_allow_html=True,
 )
+# JSON helpers use orjson when installed, falling back to the stdlib
+def loads_json(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def read_json(fp):
+    with open(fp, 'rb') as f:
+        return loads_json(f.read())
+
+def write_json(fp, obj):
+    if orjson is not None:
+        with open(fp, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(fp, 'w') as f:
+            json.dump(obj, f, indent=2)
+
 # Load friendly name mapping for stats and zones → planet names
 MAP_STAT_FILE = 'data/map_stat_names.json'
 try:
-    with open(MAP_STAT_FILE) as mf:
-        MAP_STAT_NAMES = json.load(mf)
+    MAP_STAT_NAMES = read_json(MAP_STAT_FILE)
 except FileNotFoundError:
     MAP_STAT_NAMES = {}
 
+# Series form of the mapping so renames run as one vectorized lookup
+_MAP_STAT_SERIES = pd.Series(MAP_STAT_NAMES, dtype=object)
+
+# Special mission keys, keyed by mission base id; static, so derived once at import
+COMPLETED_KEYS = [k for k in MAP_STAT_NAMES if k.startswith('covert_complete_mission')]
+ATTEMPTED_KEYS = [k for k in MAP_STAT_NAMES if k.startswith('covert_round_attempted_mission')]
+BASE_TO_COMPLETED = {
+    key.replace('covert_complete_mission_', ''): MAP_STAT_NAMES.get(key, key)
+    for key in COMPLETED_KEYS
+}
+BASE_TO_ATTEMPTS = {
+    base: [MAP_STAT_NAMES.get(a) for a in ATTEMPTED_KEYS if base in a]
+    for base in BASE_TO_COMPLETED
+}
+
 # Load zone definitions (thresholds & alignment for each planet)
 ZONES_FILE = 'data/zones.json'
 try:
-    with open(ZONES_FILE) as zf:
-        ZONE_DEFS = json.load(zf)
+    ZONE_DEFS = read_json(ZONES_FILE)
 except FileNotFoundError:
     ZONE_DEFS = {}
 
+# Star thresholds per planet as rows of STAR_THRESHOLDS (NaN = undefined star level);
+# the trailing all-NaN row stands in for planets missing from zones.json
+PLANET_INDEX = {planet: i for i, planet in enumerate(ZONE_DEFS)}
+STAR_THRESHOLDS = np.array(
+    [[defs.get(f"{i}-star") for i in (1, 2, 3)] for defs in ZONE_DEFS.values()] + [[None] * 3],
+    dtype=float,
+)
+
 # Helper to extract date from filename
+_DATE_RE = re.compile(r'tb_data_(\d{6})')
+
 def extract_date(fp):
-    name = os.path.basename(fp)
-    m = re.search(r'tb_data_(\d{6})', name)
-    return datetime.strptime(m.group(1), '%d%m%y') if m else None
+    m = _DATE_RE.search(os.path.basename(fp))
+    if not m:
+        return None
+    # DDMMYY; slicing the digits avoids strptime's format parsing
+    s = m.group(1)
+    return datetime(2000 + int(s[4:6]), int(s[2:4]), int(s[:2]))
+
+# Parquet copies of the flattened TB stats, rebuilt when the JSON is newer
+PARQUET_CACHE_DIR = os.path.join('data', 'cache')
+
+# Compact dtypes for flattened stat rows: TB scores fit in int32, ids repeat
+# heavily so they stay categorical (integer codes for groupby)
+STAT_DTYPES = {'memberId': 'category', 'score': 'int32', 'mapStatId': 'category'}
+
+# Round names rolled up into the P3-P6 totals
+ATTEMPT_NAMES = [f"Mission Attempt Round {p}" for p in range(3, 7)]
+WAVE_NAMES    = [f"Waves Completed Round {p}" for p in range(3, 7)]
+
+# Sum scores into a Player x StatName grid; groupby/unstack over categorical
+# codes avoids pivot_table's overhead while keeping its sorted, plain axes
+# (sums stay int64 here; build_pivot downcasts once the totals are known)
+def fast_pivot(df):
+    df = df.assign(
+        Player=pd.Categorical(df['Player']),
+        StatName=pd.Categorical(df['StatName']),
+    )
+    piv = (
+        df
+        .groupby(['Player', 'StatName'], observed=True)['score']
+        .sum()
+        .unstack('StatName', fill_value=0)
+        .astype(np.int64)
+    )
+    piv.index = piv.index.astype(object)
+    piv.columns = piv.columns.astype(object)
+    return piv
+
+# Map a categorical column through a lookup Series once per category, not per row;
+# the result is categorical too, so fast_pivot groups on codes without rehashing strings
+def map_categories(col, mapping, keep_unmapped=False):
+    cats = col.cat.categories.to_series()
+    names = cats.map(mapping)
+    if keep_unmapped:
+        names = names.fillna(cats)
+    # allow_fill keeps null ids (code -1) as NaN so groupby drops them
+    mapped = pd.Categorical(names.to_numpy()).take(col.cat.codes.to_numpy(), allow_fill=True)
+    return pd.Series(mapped, index=col.index)
+
+# Pivot a snapshot's stat rows into Player x StatName with P3-P6 totals
+def build_pivot(stat_df, id_to_name):
+    if stat_df.empty:
+        return None
+    stat_df = stat_df.assign(
+        Player=map_categories(stat_df['memberId'], id_to_name),
+        StatName=map_categories(stat_df['mapStatId'], _MAP_STAT_SERIES, keep_unmapped=True),
+    )
+    piv = fast_pivot(stat_df)
+    piv['Total Attempts P3-P6'] = piv.reindex(columns=ATTEMPT_NAMES, fill_value=0).to_numpy().sum(axis=1)
+    piv['Total Completed Waves P3-P6'] = piv.reindex(columns=WAVE_NAMES, fill_value=0).to_numpy().sum(axis=1)
+    # Scores fit int32 in practice; only keep int64 if a sum would overflow
+    if piv.to_numpy().max(initial=0) <= np.iinfo(np.int32).max:
+        piv = piv.astype(np.int32, copy=False)
+    return piv
+
+# Pivot of one snapshot, keyed on its JSON mtime so an edit re-pivots only that file
+# (uncapped: a size limit below the snapshot count would evict entries mid-scan)
+@st.cache_resource
+def load_snapshot_pivot(fp, mtime, pq_fp, id_to_name):
+    return build_pivot(load_stat_table(fp, mtime, pq_fp), pd.Series(id_to_name, dtype=object))
+
+# {date: pivot} for every snapshot with stats; the pivots are shared, so only read them
+def build_all_pivots(manifest, id_to_name):
+    pivots = {}
+    for date, fp, mtime, pq_fp in manifest:
+        piv = load_snapshot_pivot(fp, mtime, pq_fp, id_to_name)
+        if piv is not None:
+            pivots[date] = piv
+    return pivots
+
+# Every run's pivot stacked as (Date, Player) rows, independent of widget state;
+# NaN marks a field a run never recorded
+@st.cache_resource(max_entries=1)
+def build_history(manifest, id_to_name):
+    return pd.concat(build_all_pivots(manifest, id_to_name), names=['Date', 'Player'])
+
+# Special mission status per player: 1 completed, -1 attempted only, 0 neither
+def build_status_grid(pivot_df):
+    comp_df = pivot_df.reindex(columns=list(BASE_TO_COMPLETED.values()), fill_value=0)
+    att_df = pd.DataFrame(
+        {base: pivot_df.reindex(columns=cols, fill_value=0).sum(axis=1)
+         for base, cols in BASE_TO_ATTEMPTS.items()},
+        index=pivot_df.index,
+    ).reindex(columns=list(BASE_TO_COMPLETED), fill_value=0)
+    status_df = pd.DataFrame(
+        np.where(comp_df.values > 0, 1, np.where(att_df.values > 0, -1, 0)),
+        index=pivot_df.index,
+        columns=list(BASE_TO_COMPLETED.values()),
+    )
+    status_df.index.name = 'Player'
+    return status_df
 
+# Cell colours for the status grid, built for the whole frame in one pass
+def color_all(df):
+    vals = df.to_numpy()
+    css = np.select(
+        [vals == 1, vals == -1],
+        ['background-color: #66be25; color: transparent',
+         'background-color: #be4525; color: transparent'],
+        default='background-color: #f59406; color: transparent',
+    )
+    return pd.DataFrame(css, index=df.index, columns=df.columns)
+
+# Flatten a snapshot's currentStat into memberId/score/mapStatId rows
+# (the TB schema is fixed, so a direct walk beats json_normalize's generic traversal)
+def flatten_current_stat(stat_list):
+    member_ids, scores, map_ids = [], [], []
+    for entry in stat_list:
+        mid = entry['mapStatId']
+        for ps in entry.get('playerStat', []):
+            member_ids.append(ps['memberId'])
+            scores.append(ps['score'])
+            map_ids.append(mid)
+    stat_df = pd.DataFrame({
+        'memberId': member_ids,
+        'score': np.asarray(scores, dtype=np.int32),
+        'mapStatId': map_ids,
+    })
+    return stat_df.astype(STAT_DTYPES)
+
+# Write the flattened stats of a TB JSON to data/cache unless a fresh copy exists;
+# the file is written under a temp name and swapped in, so a crash or a concurrent
+# conversion never leaves a partial Parquet that looks newer than its JSON
+def _ensure_parquet(fp, force=False):
+    name = os.path.splitext(os.path.basename(fp))[0]
+    pq_fp = os.path.join(PARQUET_CACHE_DIR, f"{name}.parquet")
+    if force or not os.path.exists(pq_fp) or os.path.getmtime(pq_fp) < os.path.getmtime(fp):
+        run = read_json(fp)
+        os.makedirs(PARQUET_CACHE_DIR, exist_ok=True)
+        stat_df = flatten_current_stat(run.get('currentStat', []))
+        fd, tmp_fp = tempfile.mkstemp(dir=PARQUET_CACHE_DIR, suffix='.parquet.tmp')
+        os.close(fd)
+        try:
+            stat_df.to_parquet(tmp_fp, compression='zstd', index=False)
+            os.replace(tmp_fp, pq_fp)
+        finally:
+            if os.path.exists(tmp_fp):
+                os.remove(tmp_fp)
+    return pq_fp
+
+# Date-sorted (date, path) pairs for every TB snapshot, extracting each date once
+def list_tb_files():
+    dated = [(extract_date(f), f) for f in glob.glob(os.path.join('data', 'tb_data_*.json'))]
+    dated = [(d, f) for d, f in dated if d]
+    dated.sort(key=lambda x: x[0])
+    return dated
+
+# (date, json path, json mtime, parquet path) per snapshot: cheap to hash and copy,
+# and the mtimes make every downstream cache key change when a file is edited
 @st.cache_data
-def load_all_json():
-    files = glob.glob(os.path.join('data', 'tb_data_*.json'))
-    files = [f for f in files if extract_date(f)]
-    files.sort(key=extract_date)
-    dates, jsons = [], []
-    for fp in files:
-        dates.append(extract_date(fp))
-        with open(fp) as f:
-            jsons.append(json.load(f))
-    return dates, jsons
+def load_manifest():
+    dated = list_tb_files()
+    if not dated:
+        return ()
+    files = [f for _, f in dated]
+    # Files are independent, so convert them concurrently; map keeps date order
+    with ThreadPoolExecutor(max_workers=min(8, len(files))) as ex:
+        pq_files = list(ex.map(_ensure_parquet, files))
+    return tuple(
+        (d, fp, os.path.getmtime(fp), pq_fp)
+        for (d, fp), pq_fp in zip(dated, pq_files)
+    )
+
+# Stat rows of one snapshot, shared across reruns without copying; an unreadable
+# cache file (e.g. truncated by an interrupted copy) is rebuilt from the JSON
+@st.cache_resource
+def load_stat_table(fp, mtime, pq_fp):
+    try:
+        stat_df = pd.read_parquet(pq_fp)
+    except (OSError, ValueError):
+        stat_df = pd.read_parquet(_ensure_parquet(fp, force=True))
+    return stat_df.astype(STAT_DTYPES)
+
+# Zone status and member names are only read from the latest snapshot; the
+# playerId -> playerName map is built here so reruns don't walk the members again
+@st.cache_resource(max_entries=1)
+def load_latest_json(fp, mtime):
+    jb = read_json(fp)
+    id_to_name = {m['playerId']: m['playerName'] for m in jb.get('member', [])}
+    return jb, id_to_name
 
 def main():
     st.set_page_config(page_title="SWGOH", page_icon="🔥", layout="wide")
     st.title("Guild Data")
 
     # Load JSON snapshots
-    json_dates, jsons = load_all_json()
-    if not jsons:
+    manifest = load_manifest()
+    if not manifest:
         st.warning("No TB JSON files found in data folder.")
         return
-
     # Use latest snapshot
-    jb = jsons[-1]
-    members = jb.get('member', [])
-    id_to_name = {m['playerId']: m['playerName'] for m in members}
+    jb, id_to_name = load_latest_json(manifest[-1][1], manifest[-1][2])
 
     # ---- Compute and display Current Status ----
-    status = []
+    zones = []
     for cz in jb.get("conflictZoneStatus", []):
         zs = cz.get("zoneStatus", {})
         zone_id = zs.get("zoneId")
@@ -76,14 +295,16 @@ def main():
             continue
         planet = MAP_STAT_NAMES.get(zone_id, zone_id)
         alignment = ZONE_DEFS.get(planet, {}).get("Alignment", "Unknown")
-        thresholds = [
-            ZONE_DEFS[planet].get(f"{i}-star")
-            for i in [1, 2, 3]
-            if ZONE_DEFS.get(planet, {}).get(f"{i}-star") is not None
-        ]
-        stars = sum(1 for t in thresholds if score >= t)
-        star_str = "★" * stars + "☆" * (len(thresholds) - stars)
-        status.append((planet, alignment, score, star_str))
+        zones.append((planet, alignment, score))
+    # Count stars for every zone at once against the per-planet thresholds
+    thresholds = STAR_THRESHOLDS[[PLANET_INDEX.get(planet, -1) for planet, _, _ in zones]]
+    scores = np.array([score for _, _, score in zones], dtype=float)
+    stars = (scores[:, None] >= thresholds).sum(axis=1)
+    levels = (~np.isnan(thresholds)).sum(axis=1)
+    status = [
+        (planet, alignment, score, "★" * n + "☆" * (total - n))
+        for (planet, alignment, score), n, total in zip(zones, stars, levels)
+    ]
 
     # Create three tabs
     tab1, tab2, tab3 = st.tabs(["Guild Data", "Player History", "Edit Current TB"])
@@ -92,27 +313,12 @@ def main():
     with tab1:
         st.subheader("Guild Summary")
 
-        # Normalize stats for guild summary
-        stat_list = jb.get('currentStat', [])
-        stat_df = (
-            pd.json_normalize(stat_list, 'playerStat', ['mapStatId'])
-            if stat_list else pd.DataFrame()
-        )
-        if stat_df.empty:
+        # Normalize stats for guild summary (only the latest pivot is looked up here)
+        pivot_df = load_snapshot_pivot(*manifest[-1][1:], id_to_name)
+        if pivot_df is None:
             st.info("No currentStat data to display.")
             return
 
-        stat_df['score'] = stat_df['score'].astype(int)
-        stat_df['Player'] = stat_df['memberId'].map(id_to_name)
-        stat_df['StatName'] = stat_df['mapStatId'].map(lambda k: MAP_STAT_NAMES.get(k, k))
-
-        pivot_df = (
-            stat_df
-            .pivot_table(index='Player', columns='StatName', values='score', aggfunc='sum')
-            .fillna(0)
-            .astype(int)
-        )
-
         # Define formats for summary metrics
         summary_metrics = {
             'Total Territory Points': '{:,.0f}',
@@ -123,14 +329,9 @@ def main():
             'Total Special Missions Completed': '{:,.0f}'
         }
 
-        # Compute P3-P6 totals
-        attempt_names = [f"Mission Attempt Round {p}" for p in range(3, 7)]
-        wave_names    = [f"Waves Completed Round {p}" for p in range(3, 7)]
-        pivot_df['Total Attempts P3-P6'] = pivot_df[[c for c in attempt_names if c in pivot_df.columns]].sum(axis=1)
-        pivot_df['Total Completed Waves P3-P6'] = pivot_df[[c for c in wave_names if c in pivot_df.columns]].sum(axis=1)
-
         # Build and sort summary DataFrame
-        summary_fields = [f for f in summary_metrics if f in pivot_df.columns] + [
+        cols_set = set(pivot_df.columns)
+        summary_fields = [f for f in summary_metrics if f in cols_set] + [
             'Total Attempts P3-P6', 'Total Completed Waves P3-P6'
         ]
         summary_df = pivot_df[summary_fields].copy()
@@ -139,8 +340,6 @@ def main():
         if sort_field in summary_df.columns:
             summary_df = summary_df.sort_values(sort_field, ascending=False)
 
-        summary_styled = summary_df.style.format(summary_metrics)
-
         # Guild average row
         avg_df = pd.DataFrame([summary_df.mean()])
         avg_df.index = ["Guild Average"]
@@ -150,26 +349,7 @@ def main():
         avg_styled = avg_df.style.format(avg_format)
 
         # Special mission status grid
-        completed_keys = [k for k in MAP_STAT_NAMES if k.startswith('covert_complete_mission')]
-        attempted_keys = [k for k in MAP_STAT_NAMES if k.startswith('covert_round_attempted_mission')]
-        status_dict = {}
-        for player in pivot_df.index:
-            row = {}
-            for key in completed_keys:
-                name = MAP_STAT_NAMES.get(key, key)
-                comp = pivot_df.at[player, name] if name in pivot_df.columns else 0
-                base = key.replace('covert_complete_mission_', '')
-                atts = [MAP_STAT_NAMES.get(a) for a in attempted_keys if base in a]
-                att_count = sum(pivot_df.at[player, a] for a in atts if a in pivot_df.columns)
-                row[name] = 1 if comp > 0 else (-1 if att_count > 0 else 0)
-            status_dict[player] = row
-        status_df = pd.DataFrame.from_dict(status_dict, orient='index').fillna(0).astype(int)
-        status_df.index.name = 'Player'
-        def color_map(v):
-            if v == 1:   return 'background-color: #66be25; color: transparent'
-            if v == -1:  return 'background-color: #be4525; color: transparent'
-            return 'background-color: #f59406; color: transparent'
-        styled_status = status_df.style.applymap(color_map)
+        status_df = build_status_grid(pivot_df)
 
         # Player filter multiselect
         selected = st.multiselect(
@@ -182,13 +362,11 @@ def main():
         if not selected:
             df_show = summary_df
             status_show = status_df
-            style_show = summary_styled
-            status_style_show = styled_status
         else:
             df_show = summary_df.loc[selected]
             status_show = status_df.loc[selected]
-            style_show = df_show.style.format(summary_metrics)
-            status_style_show = status_show.style.applymap(color_map)
+        style_show = df_show.style.format(summary_metrics)
+        status_style_show = status_show.style.apply(color_all, axis=None)
 
         st.dataframe(style_show, hide_index=False)
         st.download_button(
@@ -220,56 +398,59 @@ def main():
             default=["Total Waves Completed"] if sort_field in summary_fields else []
         )
         if hist_players and metrics:
-            records = []
-            for date, run in zip(json_dates, jsons):
-                df_run = (
-                    pd.json_normalize(run.get('currentStat', []), 'playerStat', ['mapStatId'])
-                    if run.get('currentStat') else pd.DataFrame()
-                )
-                if df_run.empty: continue
-                df_run['score'] = df_run['score'].astype(int)
-                df_run['Player'] = df_run['memberId'].map(id_to_name)
-                df_run['StatName'] = df_run['mapStatId'].map(lambda k: MAP_STAT_NAMES.get(k, k))
-                piv = (
-                    df_run
-                    .pivot_table(index='Player', columns='StatName', values='score', aggfunc='sum')
-                    .fillna(0).astype(int)
-                )
-                piv['Total Attempts P3-P6'] = piv[[c for c in attempt_names if c in piv.columns]].sum(axis=1)
-                piv['Total Completed Waves P3-P6'] = piv[[c for c in wave_names if c in piv.columns]].sum(axis=1)
-                for pl in hist_players:
-                    for m in metrics:
-                        if pl == "Guild Average":
-                            val = piv[m].mean() if m in piv.columns else 0
-                        else:
-                            val = piv.at[pl, m] if pl in piv.index and m in piv.columns else 0
-                        records.append({'Date': date, 'Player': pl, 'Metric': m, 'Value': val})
-            hist_df = pd.DataFrame(records).sort_values('Date')
-            chart = (
-                alt.Chart(hist_df)
-                .mark_line(point=True)
-                .encode(
-                    x=alt.X('Date:T', title='Date', axis=alt.Axis(format='%d-%m-%y')),
-                    y=alt.Y('Value:Q', title='Value'),
-                    color='Player:N',
-                    strokeDash='Metric:N'
-                )
-                .properties(width=500, height=500)
+            players_real = [pl for pl in hist_players if pl != "Guild Average"]
+            include_avg = "Guild Average" in hist_players
+            history = build_history(manifest, id_to_name).reindex(columns=metrics)
+            # Skip runs where none of the selection has data
+            has_metric = history.notna().any(axis=1).groupby(level='Date').any()
+            has_player = (
+                pd.Series(history.index.get_level_values('Player').isin(players_real), index=history.index)
+                .groupby(level='Date').any()
             )
-            st.altair_chart(chart)
+            keep = has_metric & (has_player | include_avg)
+            dates = keep.index[keep]
+            history = history.fillna(0)
+            parts = []
+            if players_real:
+                grid = pd.MultiIndex.from_product([dates, players_real], names=['Date', 'Player'])
+                parts.append(history.reindex(grid, fill_value=0))
+            if include_avg:
+                avg = history.groupby(level='Date').mean().reindex(dates)
+                parts.append(avg.assign(Player="Guild Average").set_index('Player', append=True))
+            hist_df = (
+                pd.concat(parts)
+                .rename_axis(columns=None)
+                .reset_index()
+                .melt(id_vars=['Date', 'Player'], var_name='Metric', value_name='Value')
+                .sort_values('Date')
+                .astype({'Value': 'float32'})
+            )
+            if hist_df.empty:
+                st.info("No history for the selected players and fields.")
+            else:
+                chart = (
+                    alt.Chart(hist_df)
+                    .mark_line(point=True)
+                    .encode(
+                        x=alt.X('Date:T', title='Date', axis=alt.Axis(format='%d-%m-%y')),
+                        y=alt.Y('Value:Q', title='Value'),
+                        color='Player:N',
+                        strokeDash='Metric:N'
+                    )
+                    .properties(width=500, height=500)
+                )
+                st.altair_chart(chart)
         else:
             st.info("Select at least one player and one field.")
 
     # ---- Tab 3: Edit Current TB ----
     with tab3:
         st.header("Edit Current TB")
-        files = glob.glob(os.path.join('data', 'tb_data_*.json'))
-        files = [f for f in files if extract_date(f)]
-        files.sort(key=extract_date)
+        files = list_tb_files()
         if not files:
             st.warning("No TB JSON files to edit.")
         else:
-            latest_fp = files[-1]
+            latest_fp = files[-1][1]
             st.write(f"Editing file: {latest_fp}")
             try:
                 with open(latest_fp) as f:
@@ -279,17 +460,26 @@ def main():
                 raw = ""
             edited = st.text_area("Edit JSON here:", value=raw, height=600)
             if st.button("Save Changes"):
-                try:
-                    parsed = json.loads(edited)
-                    with open(latest_fp, "w") as f:
-                        json.dump(parsed, f, indent=2)
-                    st.success("File saved successfully!")
-                    # Clear cache so load_all_json() will re-read on next run
-                    st.cache_data.clear()
-                    # Prompt user to manually refresh
-                    st.info("Please refresh your browser to see the updated data.")
-                except Exception as e:
-                    st.error(f"Error saving file: {e}")
+                if edited == raw:
+                    st.info("No changes to save.")
+                else:
+                    try:
+                        parsed = loads_json(edited)
+                        write_json(latest_fp, parsed)
+                        # Drop the parsed copy before the caches rebuild from disk
+                        del parsed
+                        gc.collect()
+                        st.success("File saved successfully!")
+                        # Clear cache so load_manifest() will re-read on next run
+                        st.cache_data.clear()
+                        # Per-file caches are keyed on mtime, so drop them rather than
+                        # leave the pre-edit copies resident for the life of the process
+                        load_snapshot_pivot.clear()
+                        load_stat_table.clear()
+                        # Prompt user to manually refresh
+                        st.info("Please refresh your browser to see the updated data.")
+                    except Exception as e:
+                        st.error(f"Error saving file: {e}")
 
 if __name__ == '__main__':
     main()